@@ -0,0 +1,44 @@
+"""
+AXIOM Core
+Universal structural analysis for scientific systems
+
+Public names are resolved on first access so that ``import axiom`` does
+not pay for enum, typing or parser setup until something is used.
+"""
+
+__version__ = "1.4"
+
+_LAZY_ATTRIBUTES = {
+    'AXIOMNode': 'axiom.nodes',
+    'NATURAL_ORDER': 'axiom.nodes',
+    'STICalculator': 'axiom.sti',
+    'BaseAXIOMParser': 'axiom.parsers',
+    'BasicAXIOMParser': 'axiom.parsers',
+    'WordAXIOMParser': 'axiom.parsers',
+    'EnhancedAXIOMParser': 'axiom.parsers',
+    'SmartAXIOMParser': 'axiom.parsers',
+    'AdvancedAXIOMParser': 'axiom.parsers',
+    'DEFAULT_VERSION': 'axiom.parsers',
+    'PARSER_REGISTRY': 'axiom.parsers',
+    'available_versions': 'axiom.parsers',
+    'get_parser': 'axiom.parsers',
+    'register_parser': 'axiom.parsers'
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,102 @@
+"""
+AXIOM Core - Command Line Interface
+Shared by ``python -m axiom`` and the legacy per-version scripts
+"""
+
+import sys
+
+from axiom.parsers import DEFAULT_VERSION, available_versions, get_parser
+from axiom.sti import STICalculator
+
+EXAMPLE_TEXTS = (
+    "Neurons process information to form memories",
+    "Energy flows through ecosystems transforming nutrients",
+    "Electrons orbit nucleus creating stable atoms",
+    "Water cycles from ocean to clouds to rain and back",
+    "Algorithms process data to generate insights",
+    "Quantum particles have potential states until measured",
+    "Chemical bonds connect atoms to form molecules",
+    "The big bang created the universe which evolved life"
+)
+
+
+def analyze(text: str, version: str = DEFAULT_VERSION) -> dict:
+    symbols = get_parser(version).parse_text(text)
+    return STICalculator().calculate_sti(symbols)
+
+
+def print_result(result: dict) -> None:
+    print(f"\n🔍 Found Symbols: {''.join(result['symbols'])}")
+    print(f"📊 STI Score: {result['sti_score']}")
+
+    if result['missing_nodes']:
+        print(f"⚠️  Missing: {', '.join(result['missing_nodes'])}")
+    else:
+        print("✅ Structurally complete!")
+
+
+def run_examples(version: str = DEFAULT_VERSION,
+                 title: str = "🚀 AXIOM PARSER - EXAMPLE SYSTEMS",
+                 footer: str = "🎯 Parser testing complete!") -> None:
+    """Run the example systems through one parser version"""
+    parser = get_parser(version)
+    calculator = STICalculator()
+
+    print(title)
+    print("=" * 60)
+
+    for i, text in enumerate(EXAMPLE_TEXTS, 1):
+        symbols = parser.parse_text(text)
+        result = calculator.calculate_sti(symbols)
+
+        print(f"\n{i}. {text}")
+        print(f"   🔍 Symbols: {''.join(symbols)}")
+        print(f"   📊 STI: {result['sti_score']}")
+
+        if result['missing_nodes']:
+            print(f"   ⚠️  Missing: {', '.join(result['missing_nodes'])}")
+        else:
+            print("   ✅ Structurally complete!")
+
+    print("\n" + "=" * 60)
+    print(footer)
+
+
+def interactive(version: str = DEFAULT_VERSION,
+                title: str = "🌌 AXIOM Structural Analysis CLI",
+                width: int = 40) -> None:
+    """Prompt for system descriptions until 'quit' or end of input"""
+    print(title)
+    print("=" * width)
+
+    while True:
+        try:
+            text = input("\n📝 Enter system description (or 'quit'): ")
+        except EOFError:
+            break
+
+        if text.lower() == 'quit':
+            break
+
+        print_result(analyze(text, version))
+        print("-" * width)
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(
+        prog="axiom", description="AXIOM structural analysis of system descriptions")
+    arg_parser.add_argument("text", nargs="*", help="description to analyze (omit for interactive mode)")
+    arg_parser.add_argument("-p", "--parser-version", default=DEFAULT_VERSION, choices=available_versions(),
+                            help=f"parser version to use (default: {DEFAULT_VERSION})")
+    arg_parser.add_argument("--examples", action="store_true", help="run the built-in example systems")
+    args = arg_parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    if args.examples:
+        run_examples(args.parser_version, f"🚀 AXIOM PARSER v{args.parser_version} - EXAMPLE SYSTEMS")
+    elif args.text:
+        print_result(analyze(" ".join(args.text), args.parser_version))
+    else:
+        interactive(args.parser_version)
+    return 0
@@ -0,0 +1,35 @@
+"""
+AXIOM Nodes
+The 18 core structural symbols shared by every parser version
+"""
+
+from enum import Enum
+
+
+class AXIOMNode(str, Enum):
+    INITIATION = "│"
+    POTENTIAL = "¬"
+    FLOW = "⌒"
+    PROCESSING = "█"
+    RAW_FORCE = "┼"
+    IMPRINT = "┴"
+    CONTAINMENT = "—"
+    RECURRENCE = "┘"
+    EMERGENCE = "┬"
+    RETURN = "⌑"
+    FOCUS = "◆"
+    MANIFESTATION = "┌"
+    DOMAIN = "└"
+    EMISSION = "┐"
+    GUIDANCE = "├"
+    CONNECTION = "┤"
+    SYNCHRONIZATION = "≡"
+    IDENTITY = "⟦⟧"
+
+
+# Canonical causal ordering applied to parsed symbols
+NATURAL_ORDER = (
+    AXIOMNode.INITIATION, AXIOMNode.FLOW, AXIOMNode.PROCESSING,
+    AXIOMNode.IMPRINT, AXIOMNode.EMERGENCE, AXIOMNode.CONTAINMENT,
+    AXIOMNode.RECURRENCE, AXIOMNode.RETURN
+)
@@ -0,0 +1,314 @@
+"""
+AXIOM Parsers
+Versioned keyword parsers behind a single registry
+
+Lexicons and matchers are built the first time a parser is used, so
+importing this module (or looking a parser up) stays cheap for
+short-lived CLI runs and freshly spawned worker processes.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+
+from axiom.nodes import AXIOMNode, NATURAL_ORDER
+
+
+def _basic_lexicon() -> dict[AXIOMNode, list[str]]:
+    return {
+        AXIOMNode.FLOW: ['flow', 'transfer', 'move', 'current', 'propagate', 'travel'],
+        AXIOMNode.PROCESSING: ['process', 'transform', 'compute', 'convert', 'calculate', 'change'],
+        AXIOMNode.IMPRINT: ['store', 'remember', 'imprint', 'encode', 'memorize', 'save'],
+        AXIOMNode.EMERGENCE: ['emerge', 'create', 'form', 'generate', 'arise', 'become'],
+        AXIOMNode.CONTAINMENT: ['contain', 'bound', 'limit', 'restrict', 'constrain', 'within'],
+        AXIOMNode.RECURRENCE: ['repeat', 'cycle', 'oscillate', 'recur', 'periodic', 'rhythm'],
+        AXIOMNode.INITIATION: ['start', 'begin', 'initiate', 'source', 'origin'],
+        AXIOMNode.IDENTITY: ['identity', 'self', 'essence', 'unique', 'distinct']
+    }
+
+
+def _enhanced_lexicon() -> dict[AXIOMNode, list[str]]:
+    # Expanded keyword mappings with domain-specific terms
+    return {
+        AXIOMNode.INITIATION: [
+            'start', 'begin', 'initiate', 'source', 'origin', 'create', 'generate',
+            'big bang', 'birth', 'formation', 'emit', 'release', 'produce'
+        ],
+        AXIOMNode.FLOW: [
+            'flow', 'transfer', 'move', 'current', 'propagate', 'travel', 'transmit',
+            'orbit', 'revolve', 'circulate', 'stream', 'pass', 'spread', 'diffuse',
+            'conduct', 'convey', 'channel'
+        ],
+        AXIOMNode.PROCESSING: [
+            'process', 'transform', 'compute', 'convert', 'calculate', 'change',
+            'react', 'metabolize', 'digest', 'analyze', 'synthesize', 'modify',
+            'adapt', 'evolve', 'learn', 'adjust'
+        ],
+        AXIOMNode.IMPRINT: [
+            'store', 'remember', 'imprint', 'encode', 'memorize', 'save', 'record',
+            'learn', 'retain', 'capture', 'encode', 'pattern', 'memory', 'engram',
+            'crystalize', 'solidify'
+        ],
+        AXIOMNode.EMERGENCE: [
+            'emerge', 'create', 'form', 'generate', 'arise', 'become', 'develop',
+            'consciousness', 'intelligence', 'life', 'complexity', 'self-organize',
+            'appear', 'manifest', 'arise', 'result'
+        ],
+        AXIOMNode.CONTAINMENT: [
+            'contain', 'bound', 'limit', 'restrict', 'constrain', 'within',
+            'stable', 'attract', 'hold', 'capture', 'trap', 'confine', 'enclose',
+            'orbit', 'gravitational', 'magnetic', 'cell membrane', 'barrier'
+        ],
+        AXIOMNode.RECURRENCE: [
+            'repeat', 'cycle', 'oscillate', 'recur', 'periodic', 'rhythm',
+            'pattern', 'loop', 'heartbeat', 'seasonal', 'daily', 'annual',
+            'feedback', 'resonate', 'pulse', 'vibrate'
+        ],
+        AXIOMNode.IDENTITY: [
+            'identity', 'self', 'essence', 'unique', 'distinct', 'individual',
+            'character', 'nature', 'personality', 'species', 'type', 'kind',
+            'quantum state', 'eigenstate', 'signature'
+        ],
+        AXIOMNode.POTENTIAL: [
+            'potential', 'capacity', 'ability', 'capability', 'possibility',
+            'quantum', 'probability', 'may', 'could', 'might', 'latent',
+            'unexpressed', 'dormant', 'inherent'
+        ],
+        AXIOMNode.CONNECTION: [
+            'connect', 'bond', 'link', 'relationship', 'network', 'synapse',
+            'chemical bond', 'social', 'interact', 'communicate', 'associate',
+            'correlate', 'relate'
+        ]
+    }
+
+
+def _smart_lexicon() -> dict[AXIOMNode, list[str]]:
+    # Root forms; word variations are handled by the matcher
+    return {
+        AXIOMNode.INITIATION: ['start', 'begin', 'initiate', 'source', 'origin', 'create', 'generate', 'big bang', 'birth', 'formation', 'emit'],
+        AXIOMNode.FLOW: ['flow', 'transfer', 'move', 'current', 'propagate', 'travel', 'transmit', 'orbit', 'revolve', 'circulate', 'stream'],
+        AXIOMNode.PROCESSING: ['process', 'transform', 'compute', 'convert', 'calculate', 'change', 'react', 'metabolize', 'digest', 'analyze'],
+        AXIOMNode.IMPRINT: ['store', 'remember', 'imprint', 'encode', 'memorize', 'save', 'record', 'learn', 'retain', 'capture', 'memory'],
+        AXIOMNode.EMERGENCE: ['emerge', 'create', 'form', 'generate', 'arise', 'become', 'develop', 'consciousness', 'intelligence', 'life'],
+        AXIOMNode.CONTAINMENT: ['contain', 'bound', 'limit', 'restrict', 'constrain', 'within', 'stable', 'attract', 'hold', 'capture', 'orbit'],
+        AXIOMNode.RECURRENCE: ['repeat', 'cycle', 'oscillate', 'recur', 'periodic', 'rhythm', 'pattern', 'loop', 'heartbeat', 'seasonal'],
+        AXIOMNode.IDENTITY: ['identity', 'self', 'essence', 'unique', 'distinct', 'individual', 'character', 'nature'],
+        AXIOMNode.POTENTIAL: ['potential', 'capacity', 'ability', 'capability', 'possibility', 'quantum', 'probability', 'latent'],
+        AXIOMNode.CONNECTION: ['connect', 'bond', 'link', 'relationship', 'network', 'synapse', 'chemical bond', 'interact']
+    }
+
+
+def _advanced_word_variations() -> dict[str, list[str]]:
+    # Common word variations mapping
+    return {
+        'memory': ['memories', 'memorization', 'memorize'],
+        'cycle': ['cycles', 'cycling', 'cyclical'],
+        'flow': ['flows', 'flowing', 'flowed'],
+        'process': ['processes', 'processing', 'processed'],
+        'transform': ['transforms', 'transforming', 'transformation'],
+        'orbit': ['orbits', 'orbiting', 'orbital'],
+        'create': ['creates', 'creating', 'creation', 'created'],
+        'form': ['forms', 'forming', 'formation', 'formed'],
+        'measure': ['measures', 'measuring', 'measurement', 'measured']
+    }
+
+
+Matcher = Callable[[str], bool]
+
+
+def _freeze(mapping: Mapping) -> Mapping:
+    """Read-only copy with tuple values, so in-place edits fail loudly"""
+    return MappingProxyType({key: tuple(values) for key, values in mapping.items()})
+
+
+class BaseAXIOMParser(ABC):
+    """Shared parse pipeline; subclasses supply a lexicon and matchers
+
+    Subclasses implement ``_build_lexicon`` (symbol -> keywords) and
+    ``_build_matchers`` ([(symbol, text -> bool)]). For whole-word
+    matching, subclass ``WordAXIOMParser`` and implement only
+    ``_build_lexicon``.
+
+    ``keyword_mappings`` is read-only; assign a new mapping to change it,
+    which rebuilds the matchers on the next ``parse_text`` call.
+    """
+
+    def __init__(self):
+        self._keyword_mappings = None
+        self._matchers = None
+
+    @property
+    def keyword_mappings(self) -> Mapping[AXIOMNode, tuple[str, ...]]:
+        if self._keyword_mappings is None:
+            self._keyword_mappings = _freeze(self._build_lexicon())
+        return self._keyword_mappings
+
+    @keyword_mappings.setter
+    def keyword_mappings(self, mapping: Mapping[AXIOMNode, list[str]]) -> None:
+        self._keyword_mappings = _freeze(mapping)
+        self._matchers = None
+
+    def parse_text(self, text: str) -> list[AXIOMNode]:
+        if self._matchers is None:
+            self._matchers = self._build_matchers()
+
+        text_lower = text.lower()
+        symbols = [symbol for symbol, matches in self._matchers if matches(text_lower)]
+
+        return self._apply_natural_flow(symbols)
+
+    @abstractmethod
+    def _build_lexicon(self) -> dict[AXIOMNode, list[str]]:
+        """Symbol -> keywords for this parser version"""
+
+    @abstractmethod
+    def _build_matchers(self) -> list[tuple[AXIOMNode, Matcher]]:
+        """(symbol, predicate over lower-cased text) pairs, in lexicon order"""
+
+    def _apply_natural_flow(self, symbols: list[AXIOMNode]) -> list[AXIOMNode]:
+        ordered_symbols = [s for s in NATURAL_ORDER if s in symbols]
+        remaining_symbols = [s for s in symbols if s not in NATURAL_ORDER]
+
+        return ordered_symbols + remaining_symbols
+
+
+class BasicAXIOMParser(BaseAXIOMParser):
+    """v1.0 - Basic substring keyword matching"""
+
+    def _build_lexicon(self) -> dict[AXIOMNode, list[str]]:
+        return _basic_lexicon()
+
+    def _build_matchers(self) -> list[tuple[AXIOMNode, Matcher]]:
+        def substring_matcher(keywords: tuple[str, ...]) -> Matcher:
+            return lambda text: any(keyword in text for keyword in keywords)
+
+        return [(symbol, substring_matcher(tuple(keywords)))
+                for symbol, keywords in self.keyword_mappings.items()]
+
+
+class WordAXIOMParser(BaseAXIOMParser):
+    """Whole-word matching; one compiled pattern per symbol
+
+    Subclasses implement ``_build_lexicon`` and may set ``suffixes`` or
+    override ``_irregular_forms`` to accept more word forms.
+    """
+
+    # Optional endings accepted after any keyword
+    suffixes: tuple[str, ...] = ()
+
+    def _irregular_forms(self, keyword: str) -> tuple[str, ...]:
+        return ()
+
+    def _build_matchers(self) -> list[tuple[AXIOMNode, Matcher]]:
+        import re
+
+        def alternation(words) -> str:
+            return '|'.join(map(re.escape, dict.fromkeys(words)))
+
+        suffix_group = f'(?:{alternation(self.suffixes)})?' if self.suffixes else ''
+
+        matchers = []
+        for symbol, keywords in self.keyword_mappings.items():
+            if not keywords:
+                continue
+            branches = [f'(?:{alternation(keywords)}){suffix_group}']
+            irregular = [form for keyword in keywords for form in self._irregular_forms(keyword)]
+            if irregular:
+                branches.append(alternation(irregular))
+            pattern = re.compile(r'\b(?:' + '|'.join(branches) + r')\b')
+            matchers.append((symbol, pattern.search))
+        return matchers
+
+
+class EnhancedAXIOMParser(WordAXIOMParser):
+    """v1.2 - Domain-specific vocabulary"""
+
+    def _build_lexicon(self) -> dict[AXIOMNode, list[str]]:
+        return _enhanced_lexicon()
+
+
+class SmartAXIOMParser(WordAXIOMParser):
+    """v1.3 - Smart word matching with common suffixes"""
+
+    suffixes = ('s', 'ing', 'ed', 'ion')
+
+    def _build_lexicon(self) -> dict[AXIOMNode, list[str]]:
+        return _smart_lexicon()
+
+
+class AdvancedAXIOMParser(SmartAXIOMParser):
+    """v1.4 - Advanced word variation handling"""
+
+    suffixes = ('s', 'ing', 'ed', 'ion', 'al', 'ive', 'ment')
+
+    def __init__(self):
+        super().__init__()
+        self._word_variations = None
+
+    @property
+    def word_variations(self) -> Mapping[str, tuple[str, ...]]:
+        if self._word_variations is None:
+            self._word_variations = _freeze(_advanced_word_variations())
+        return self._word_variations
+
+    @word_variations.setter
+    def word_variations(self, variations: Mapping[str, list[str]]) -> None:
+        self._word_variations = _freeze(variations)
+        self._matchers = None
+
+    def _irregular_forms(self, keyword: str) -> tuple[str, ...]:
+        return self.word_variations.get(keyword, ())
+
+
+DEFAULT_VERSION = "1.4"
+
+PARSER_REGISTRY: dict[str, type[BaseAXIOMParser]] = {
+    "1.0": BasicAXIOMParser,
+    "1.2": EnhancedAXIOMParser,
+    "1.3": SmartAXIOMParser,
+    "1.4": AdvancedAXIOMParser
+}
+
+_parser_cache: dict[str, BaseAXIOMParser] = {}
+
+
+def available_versions() -> list[str]:
+    return sorted(PARSER_REGISTRY)
+
+
+def register_parser(version: str, parser_class: type[BaseAXIOMParser]) -> None:
+    """Register (or replace) the parser used for a version
+
+    ``parser_class`` is a ``BaseAXIOMParser`` subclass, usually built on
+    ``WordAXIOMParser``.
+    """
+    if not (isinstance(parser_class, type) and issubclass(parser_class, BaseAXIOMParser)):
+        raise TypeError(f"{parser_class!r} is not a BaseAXIOMParser subclass")
+    if parser_class.__abstractmethods__:
+        raise TypeError(
+            f"{parser_class.__name__} does not implement "
+            f"{', '.join(sorted(parser_class.__abstractmethods__))}"
+        )
+    PARSER_REGISTRY[version] = parser_class
+    _parser_cache.pop(version, None)
+
+
+def get_parser(version: str = DEFAULT_VERSION) -> BaseAXIOMParser:
+    """Return the shared parser for a version, creating it on first use
+
+    The instance is shared by every caller; to customise its lexicon,
+    construct the parser class directly instead.
+    """
+    parser = _parser_cache.get(version)
+    if parser is None:
+        try:
+            parser_class = PARSER_REGISTRY[version]
+        except KeyError:
+            raise ValueError(
+                f"Unknown AXIOM parser version {version!r} "
+                f"(available: {', '.join(available_versions())})"
+            ) from None
+        parser = _parser_cache[version] = parser_class()
+    return parser
@@ -0,0 +1,40 @@
+"""
+AXIOM Structural Tension Index
+Scores a symbol sequence against the weighted NSF core nodes
+"""
+
+from __future__ import annotations
+
+from axiom.nodes import AXIOMNode
+
+
+class STICalculator:
+    def __init__(self):
+        self.nsf_weights = {
+            AXIOMNode.INITIATION: 1.0,
+            AXIOMNode.FLOW: 1.2,
+            AXIOMNode.PROCESSING: 1.5,
+            AXIOMNode.IMPRINT: 1.1,
+            AXIOMNode.EMERGENCE: 1.4,
+            AXIOMNode.CONTAINMENT: 1.0,
+            AXIOMNode.RECURRENCE: 1.1,
+            AXIOMNode.RETURN: 1.0
+        }
+
+        self.nsf_core_nodes = list(self.nsf_weights.keys())
+
+    def calculate_sti(self, symbols: list[AXIOMNode]) -> dict:
+        present_nodes = [s for s in symbols if s in self.nsf_core_nodes]
+        missing_nodes = [s for s in self.nsf_core_nodes if s not in symbols]
+
+        total_weight = sum(self.nsf_weights.values())
+        missing_weight = sum(self.nsf_weights[node] for node in missing_nodes)
+
+        sti_score = 1 - (missing_weight / total_weight)
+
+        return {
+            'symbols': symbols,
+            'missing_nodes': missing_nodes,
+            'sti_score': round(sti_score, 3),
+            'present_nodes': present_nodes
+        }
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+AXIOM Startup Benchmark
+Cold-start cost of the axiom package in freshly spawned interpreters
+
+Each scenario runs in a new process and is compared against a bare
+``python -c pass`` so only the package's own overhead is reported.
+Budgets are multiples of that bare startup time, so they follow the
+speed of the machine and interpreter. Exits non-zero when a scenario's
+median overhead exceeds its budget, or when it loads a module (such
+as ``re`` before the first whole-word parse) that should stay deferred.
+
+Ratios are ~1.25x the overheads measured on CPython 3.11.7 / Linux
+x86-64 (~12 ms bare startup), so a real regression fails the run. On
+noisy hosts, loosen them with ``--scale`` rather than editing them.
+
+    python benchmarks/bench_startup.py [--runs N] [--scale X]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BASELINE = "pass"
+
+# (name, code, overhead budget as a multiple of bare startup,
+#  modules that must still be unloaded once the code has run)
+SCENARIOS = (
+    ("import axiom", "import axiom", 0.05,
+     ("re", "typing", "enum", "axiom.parsers")),
+    ("get_parser()", "from axiom import get_parser, STICalculator; get_parser(); STICalculator()", 0.8,
+     ("re", "typing")),
+    ("first parse v1.0", "from axiom import get_parser; get_parser('1.0').parse_text('Electrons flow in orbits')", 0.8,
+     ("re", "typing")),
+    ("first parse v1.4", "from axiom import get_parser; get_parser('1.4').parse_text('Electrons flow in orbits')", 1.25,
+     ("typing",)),
+    ("one-shot CLI", "from axiom.cli import main; main(['Electrons flow in orbits creating stable atoms'])", 2.0,
+     ("typing",)),
+)
+
+# Smallest budget in ms; below this, timer and scheduler noise dominates
+NOISE_FLOOR_MS = 1.0
+
+
+def spawn_ms(code: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, check=True, stdout=subprocess.DEVNULL)
+    return (time.perf_counter() - start) * 1000
+
+
+def overhead_ms(code: str, runs: int) -> tuple:
+    """Median extra wall time of ``python -c code`` and of its paired bare interpreters"""
+    overheads, baselines = [], []
+    for _ in range(runs):
+        baseline = spawn_ms(BASELINE)
+        overheads.append(spawn_ms(code) - baseline)
+        baselines.append(baseline)
+    return statistics.median(overheads), statistics.median(baselines)
+
+
+def loaded_modules(code: str, modules: tuple) -> list:
+    """Which of ``modules`` are in sys.modules after running ``code`` in a fresh interpreter"""
+    probe = f"{code}\nimport sys\nprint(' '.join(m for m in {modules!r} if m in sys.modules))"
+    output = subprocess.run([sys.executable, "-c", probe], cwd=REPO_ROOT, check=True,
+                            capture_output=True, text=True).stdout
+    return output.splitlines()[-1].split() if output else []
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--runs", type=int, default=30, help="processes spawned per scenario")
+    arg_parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget (noisy machines)")
+    args = arg_parser.parse_args()
+
+    # Warm the bytecode cache so compilation is not measured
+    subprocess.run([sys.executable, "-m", "compileall", "-q", "axiom"], cwd=REPO_ROOT, check=True)
+
+    print("⏱️  AXIOM STARTUP BENCHMARK")
+    print("=" * 60)
+
+    failures = []
+
+    for name, code, _, deferred in SCENARIOS:
+        eager = loaded_modules(code, deferred)
+        if eager:
+            failures.append(f"{name} eagerly loaded: {', '.join(eager)}")
+
+    baseline = statistics.median(spawn_ms(BASELINE) for _ in range(args.runs))
+    print(f"{'python -c pass':<20} {baseline:8.2f} ms")
+
+    for name, code, ratio, _ in SCENARIOS:
+        # Budget against this scenario's own baselines so load drift cancels out
+        overhead, paired_baseline = overhead_ms(code, args.runs)
+        budget = max(ratio * paired_baseline, NOISE_FLOOR_MS) * args.scale
+        status = "✅" if overhead <= budget else "❌"
+        print(f"{name:<20} {overhead:+8.2f} ms  (budget {budget:.1f} ms) {status}")
+        if overhead > budget:
+            failures.append(f"{name}: {overhead:.2f} ms > {budget:.1f} ms")
+
+    print("=" * 60)
+    for failure in failures:
+        print(f"⚠️  {failure}")
+    if not failures:
+        print("🎯 All startup budgets met!")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
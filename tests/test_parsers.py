@@ -0,0 +1,116 @@
+"""
+AXIOM Parser Regression Tests
+Every parser version must reproduce the symbols recorded in
+parser_corpus.jsonl, which was generated from the original standalone
+v1.0-v1.4 scripts.
+
+    python -m pytest tests
+"""
+
+import json
+import os
+import unittest
+
+from axiom import parsers
+from axiom import (AXIOMNode, AdvancedAXIOMParser, BaseAXIOMParser, PARSER_REGISTRY, WordAXIOMParser,
+                   available_versions, get_parser, register_parser)
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "parser_corpus.jsonl")
+
+
+def load_corpus():
+    with open(CORPUS_PATH, encoding="utf-8") as corpus:
+        return [json.loads(line) for line in corpus if line.strip()]
+
+
+class ParserCorpusTest(unittest.TestCase):
+    def test_corpus_covers_every_version(self):
+        row = load_corpus()[0]
+        self.assertEqual(sorted(key for key in row if key != "text"), available_versions())
+
+    def test_parsers_match_corpus(self):
+        for row in load_corpus():
+            for version in available_versions():
+                with self.subTest(version=version, text=row["text"]):
+                    symbols = get_parser(version).parse_text(row["text"])
+                    self.assertEqual([symbol.name for symbol in symbols], row[version])
+
+
+class ParserCaseTest(unittest.TestCase):
+    def assertSymbols(self, version, text, expected):
+        self.assertEqual(get_parser(version).parse_text(text), expected)
+
+    def test_suffixes(self):
+        self.assertSymbols("1.3", "streams", [AXIOMNode.FLOW])
+        self.assertSymbols("1.3", "attractive", [])
+        self.assertSymbols("1.4", "attractive", [AXIOMNode.CONTAINMENT])
+        self.assertSymbols("1.2", "streams", [])
+
+    def test_irregular_forms(self):
+        self.assertSymbols("1.3", "memories", [])
+        self.assertSymbols("1.4", "memories", [AXIOMNode.IMPRINT])
+        self.assertSymbols("1.4", "orbital", [AXIOMNode.FLOW, AXIOMNode.CONTAINMENT])
+
+    def test_multi_word_keywords(self):
+        self.assertSymbols("1.4", "the big bang", [AXIOMNode.INITIATION])
+        self.assertSymbols("1.4", "bigbang", [])
+        self.assertSymbols("1.2", "cells self-organize", [AXIOMNode.EMERGENCE, AXIOMNode.IDENTITY])
+
+    def test_whole_words_only(self):
+        self.assertSymbols("1.0", "reform", [AXIOMNode.EMERGENCE])
+        self.assertSymbols("1.4", "reform", [])
+
+
+class KeywordMappingTest(unittest.TestCase):
+    def test_in_place_edits_fail(self):
+        parser = AdvancedAXIOMParser()
+        with self.assertRaises(TypeError):
+            parser.keyword_mappings[AXIOMNode.RETURN] = ['return']
+        with self.assertRaises(AttributeError):
+            parser.keyword_mappings[AXIOMNode.FLOW].append('return')
+
+    def test_assignment_rebuilds_matchers(self):
+        parser = AdvancedAXIOMParser()
+        self.assertEqual(parser.parse_text("returning"), [])
+
+        parser.keyword_mappings = {**parser.keyword_mappings, AXIOMNode.RETURN: ['return']}
+        self.assertEqual(parser.parse_text("returning"), [AXIOMNode.RETURN])
+
+        parser.word_variations = {'return': ['returned']}
+        self.assertEqual(parser.parse_text("memories returned"), [AXIOMNode.RETURN])
+
+
+class RegistryTest(unittest.TestCase):
+    def tearDown(self):
+        PARSER_REGISTRY.pop("test", None)
+        parsers._parser_cache.pop("test", None)
+
+    def test_incomplete_parser_is_rejected(self):
+        class NoLexicon(WordAXIOMParser):
+            pass
+
+        class NoMatchers(BaseAXIOMParser):
+            def _build_lexicon(self):
+                return {}
+
+        for parser_class in (NoLexicon, NoMatchers):
+            with self.subTest(parser_class=parser_class.__name__):
+                with self.assertRaises(TypeError):
+                    parser_class()
+                with self.assertRaises(TypeError):
+                    register_parser("test", parser_class)
+        self.assertNotIn("test", PARSER_REGISTRY)
+
+    def test_register_word_parser(self):
+        class LensParser(WordAXIOMParser):
+            suffixes = ('es',)
+
+            def _build_lexicon(self):
+                return {AXIOMNode.FOCUS: ['lens']}
+
+        register_parser("test", LensParser)
+        self.assertEqual(get_parser("test").parse_text("Lenses"), [AXIOMNode.FOCUS])
+
+
+if __name__ == "__main__":
+    unittest.main()